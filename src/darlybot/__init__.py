@@ -1,5 +1,10 @@
 """Tools for driving DJMAX RESPECT V from Lopebot tiles."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __all__ = [
     "SongIndex",
     "SongEntry",
@@ -8,7 +13,29 @@ __all__ = [
     "SongServer",
 ]
 
-from .song_index import SongEntry, SongIndex
-from .navigator import SongNavigator
-from .input_controller import DJMaxInputController
-from .server import SongServer
+# Submodules are imported on first attribute access so that the CLI can parse
+# its arguments (and print ``--help``) without loading the HTTP stack.
+_LAZY_ATTRIBUTES = {
+    "SongIndex": ".song_index",
+    "SongEntry": ".song_index",
+    "SongNavigator": ".navigator",
+    "DJMaxInputController": ".input_controller",
+    "SongServer": ".server",
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .input_controller import DJMaxInputController
+    from .navigator import SongNavigator
+    from .server import SongServer
+    from .song_index import SongEntry, SongIndex
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
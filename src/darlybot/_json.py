@@ -0,0 +1,32 @@
+"""JSON helpers that use :mod:`orjson` when it is installed."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - depends on the optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the optional dependency
+    orjson = None
+
+__all__ = ["dumps", "loads"]
+
+
+def dumps(data: Any) -> bytes:
+    """Serialise ``data`` to UTF-8 encoded JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def loads(payload: bytes) -> Any:
+    """Parse UTF-8 encoded JSON.
+
+    Raises :class:`ValueError` (including :class:`json.JSONDecodeError`) for
+    malformed input with either backend.
+    """
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode("utf-8"))
@@ -2,21 +2,50 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
-from .default_songs import DEFAULT_SONG_CSV
-from .input_controller import DJMaxInputController, SimulatedInputController
-from .navigator import SongNavigator
-from .server import SongServer
-from .song_index import SongIndex
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .song_index import SongIndex
 
 _DEFAULT_PORT = 8972
+_CSV_NAME = "곡순서.csv"
+_LOG_FORMAT = "[%(levelname)s] %(message)s"
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
+# What ``build_argument_parser().parse_args([])`` returns, kept as a constant
+# so the default launch can skip parsing altogether.
+_DEFAULT_ARGS = argparse.Namespace(
+    csv=None,
+    host="127.0.0.1",
+    port=_DEFAULT_PORT,
+    window_title="DJMAX RESPECT V",
+    activation_delay=0.3,
+    key_delay=0.08,
+    page_size=0,
+    dry_run=False,
+    version=False,
+    log_level="INFO",
+)
 
+
+@lru_cache(maxsize=1)
 def build_argument_parser() -> argparse.ArgumentParser:
+    """Return the command line parser, built once per process."""
+
     parser = argparse.ArgumentParser(
         prog="darlybot",
         description=(
@@ -48,15 +77,26 @@ def build_argument_parser() -> argparse.ArgumentParser:
         type=float,
         help="각 키 입력 사이의 대기 시간 (초)",
     )
+    parser.add_argument(
+        "--page-size",
+        default=0,
+        type=int,
+        help="PageUp/PageDown 한 번에 이동하는 곡 수 (0 이면 사용하지 않음)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="키 입력을 실제로 전송하지 않고 API 만 노출",
     )
+    parser.add_argument(
+        "--version",
+        action="store_true",
+        help="버전 정보를 출력하고 종료",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=list(_LOG_LEVELS),
         help="로그 레벨",
     )
     return parser
@@ -66,7 +106,6 @@ def resolve_csv_path(explicit: Optional[Path]) -> Optional[Path]:
     if explicit:
         return explicit
 
-    candidates = []
     base_candidates: Iterable[Path]
 
     if getattr(sys, "frozen", False):  # PyInstaller 등으로 패키징된 경우
@@ -79,44 +118,146 @@ def resolve_csv_path(explicit: Optional[Path]) -> Optional[Path]:
         module_dir = Path(__file__).resolve().parent
         base_candidates = [Path.cwd(), module_dir, module_dir.parent]
 
-    for base in base_candidates:
-        candidates.append(base / "곡순서.csv")
-        candidates.append(base / "data" / "곡순서.csv")
-
     seen = set()
-    for path in candidates:
-        if path in seen:
+    for base in base_candidates:
+        if base in seen:
             continue
-        seen.add(path)
-        if path.exists():
-            logging.getLogger(__name__).info("곡순서.csv 위치: %s", path)
-            return path
+        seen.add(base)
+        # One directory listing per base replaces a stat() per candidate.
+        names = _list_directory(base)
+        csv_key = _normcase(_CSV_NAME)
+        if csv_key in names:
+            path = base / names[csv_key]
+        else:
+            data_name = names.get(_normcase("data"))
+            data_names = _list_directory(base / data_name) if data_name else {}
+            if csv_key not in data_names:
+                continue
+            path = base / data_name / data_names[csv_key]
+        logging.getLogger(__name__).info("곡순서.csv 위치: %s", path)
+        return path
 
     return None
 
 
-def main(argv: Optional[Iterable[str]] = None) -> int:
-    parser = build_argument_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+def _normcase(name: str) -> str:
+    return os.path.normcase(name)
 
-    logging.basicConfig(
-        level=getattr(logging, args.log_level.upper(), logging.INFO),
-        format="[%(levelname)s] %(message)s",
+
+def _list_directory(directory: Path) -> Dict[str, str]:
+    """Map case-normalised entry names in ``directory`` to their real names.
+
+    Names are folded with :func:`os.path.normcase` so lookups stay
+    case-insensitive on Windows, matching what ``Path.exists()`` did.
+    """
+
+    try:
+        with os.scandir(directory) as entries:
+            return {_normcase(entry.name): entry.name for entry in entries}
+    except OSError:
+        return {}
+
+
+def configure_logging(level: int) -> None:
+    """Send log records to stderr from a background thread.
+
+    Request handlers only enqueue their records, so a slow console never
+    holds up key presses or HTTP responses.  When the host process has
+    already configured logging (tests, embedding) nothing is changed.
+    """
+
+    if logging.getLogger().handlers:
+        return
+
+    if sys.stderr is None:
+        # Windowed (``--noconsole``) builds have no stderr; skip formatting
+        # records that could never be written anywhere.
+        logging.basicConfig(level=level, handlers=[logging.NullHandler()])
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
 
-    csv_path = resolve_csv_path(args.csv)
+
+def load_song_index(csv_path: Optional[Path]) -> "SongIndex":
+    """Return the song index for ``csv_path`` or the embedded CSV data.
+
+    Parsed indexes are shared between ``main`` calls in the same process and
+    are only rebuilt when the file's modification time changes.
+    """
+
+    mtime_ns = -1
     if csv_path is not None:
         try:
-            index = SongIndex(csv_path)
-        except FileNotFoundError as exc:
-            parser.error(str(exc))
-            return 2
+            mtime_ns = csv_path.stat().st_mtime_ns
+        except OSError:
+            pass  # Let SongIndex report the missing file.
+    return _load_song_index(csv_path, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_song_index(csv_path: Optional[Path], mtime_ns: int) -> "SongIndex":
+    from .song_index import SongIndex
+
+    if csv_path is None:
+        from .default_songs import DEFAULT_SONG_CSV
+
+        return SongIndex.from_csv_text(DEFAULT_SONG_CSV, name="embedded 곡순서.csv")
+    return SongIndex(csv_path)
+
+
+def package_version() -> str:
+    """Return the installed package version, if the metadata is available."""
+
+    from importlib import metadata
+
+    try:
+        return metadata.version("darlybot")
+    except metadata.PackageNotFoundError:  # pragma: no cover - frozen builds
+        return "unknown"
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    arguments = list(argv) if argv is not None else sys.argv[1:]
+    # ``--version`` on its own needs none of the parser or the helper modules.
+    if arguments == ["--version"]:
+        print(f"darlybot {package_version()}")
+        return 0
+
+    if arguments:
+        args = build_argument_parser().parse_args(arguments)
     else:
+        # Double-click launches pass no arguments; every value is a default.
+        args = argparse.Namespace(**vars(_DEFAULT_ARGS))
+    if args.version:
+        print(f"darlybot {package_version()}")
+        return 0
+
+    configure_logging(_LOG_LEVELS[args.log_level])
+
+    # Imported only once the arguments are valid so that ``--help`` and usage
+    # errors exit without loading the CSV, input and HTTP modules.
+    from .input_controller import DJMaxInputController, SimulatedInputController
+    from .navigator import SongNavigator
+    from .server import SongServer
+
+    csv_path = resolve_csv_path(args.csv)
+    if csv_path is None:
         logging.getLogger(__name__).info("내장된 곡순서.csv 데이터를 사용합니다.")
-        index = SongIndex.from_csv_text(
-            DEFAULT_SONG_CSV,
-            name="embedded 곡순서.csv",
-        )
+    try:
+        index = load_song_index(csv_path)
+    except FileNotFoundError as exc:
+        build_argument_parser().error(str(exc))
+        return 2
     if args.dry_run:
         controller = SimulatedInputController()
         logging.info("드라이런 모드로 실행 중입니다. 키 입력은 전송되지 않습니다.")
@@ -127,7 +268,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             key_delay=args.key_delay,
         )
 
-    navigator = SongNavigator(index, controller)
+    navigator = SongNavigator(index, controller, page_size=args.page_size)
     server = SongServer(
         navigator,
         index=index,
@@ -1,9 +1,13 @@
 """Input controller implementations."""
 from __future__ import annotations
 
+import contextlib
 import logging
+import sys
 import time
-from typing import Any, Iterable, List, Sequence
+from functools import partial
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
 
 from .navigator import InputController
 from .song_index import SCROLL_DOWN_KEY, SCROLL_UP_KEY
@@ -15,6 +19,13 @@ __all__ = [
 
 _LOGGER = logging.getLogger(__name__)
 
+#: How long before a key deadline ``_sleep_until`` switches to spinning.
+_SPIN_THRESHOLD = 0.002
+
+#: Backoff between ``isActive`` checks while waiting for the game window to
+#: come to the foreground (about 0.3 s in total).
+_ACTIVATION_POLL_DELAYS = (0.01, 0.02, 0.04, 0.08, 0.16)
+
 _SPECIAL_KEY_NAMES = {
     "pageup": "page_up",
     "pagedown": "page_down",
@@ -35,6 +46,42 @@ _SPECIAL_KEY_NAMES = {
 }
 
 
+def _sleep_until(deadline: float) -> None:
+    """Sleep until ``time.perf_counter()`` reaches ``deadline``.
+
+    ``time.sleep`` may overshoot by a timer tick, so the last couple of
+    milliseconds are spent spinning instead.
+    """
+
+    remaining = deadline - time.perf_counter()
+    if remaining > _SPIN_THRESHOLD:
+        time.sleep(remaining - _SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
+
+
+@contextlib.contextmanager
+def _high_resolution_timer() -> Iterator[None]:
+    """Raise the Windows timer resolution to 1 ms for the enclosed block.
+
+    The default 15.6 ms tick makes short ``key_delay`` values round up badly.
+    Other platforms already sleep with sub-millisecond precision.
+    """
+
+    if sys.platform != "win32":
+        yield
+        return
+
+    import ctypes
+
+    winmm = ctypes.WinDLL("winmm")
+    winmm.timeBeginPeriod(1)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(1)
+
+
 class DJMaxInputController(InputController):
     """Send key presses directly to the DJMAX RESPECT V client."""
 
@@ -52,53 +99,97 @@ class DJMaxInputController(InputController):
         self._keyboard_controller: Any | None = None
         self._mouse_module: Any | None = None
         self._mouse_controller: Any | None = None
+        self._window_module: Any | None = None
+        self._window: Any | None = None
+        self._key_codes: Dict[str, Any] = {}
 
     def focus_window(self) -> None:
-        try:
-            import pygetwindow  # type: ignore
-        except ImportError as exc:  # pragma: no cover - requires Windows
-            raise RuntimeError(
-                "pygetwindow 모듈이 설치되어 있지 않습니다. 'pip install pygetwindow' 를 실행해주세요."
-            ) from exc
-
-        windows = pygetwindow.getWindowsWithTitle(self.window_title)
-        if not windows:
-            raise RuntimeError(
-                f"'{self.window_title}' 제목의 창을 찾을 수 없습니다. DJMAX RESPECT V 가 실행 중인지 확인해주세요."
-            )
-
-        window = windows[0]
+        window = self._find_window()
         if window.isMinimized:
             window.restore()
             time.sleep(self.activation_delay)
         window.activate()
-        time.sleep(self.activation_delay)
+        self._wait_until_active(window)
         _LOGGER.debug("Focused DJMAX window '%s'", self.window_title)
 
     def send_keys(self, keys: Iterable[str]) -> None:
-        keyboard = None
-        mouse = None
-
-        for key in keys:
-            if key == SCROLL_UP_KEY:
-                _LOGGER.debug("Scrolling up via mouse wheel")
-                if mouse is None:
-                    mouse = self._ensure_mouse_controller()
-                mouse.scroll(0, 1)
-            elif key == SCROLL_DOWN_KEY:
-                _LOGGER.debug("Scrolling down via mouse wheel")
-                if mouse is None:
-                    mouse = self._ensure_mouse_controller()
-                mouse.scroll(0, -1)
-            else:
-                if keyboard is None:
-                    keyboard = self._ensure_keyboard_controller()
-                key_code = self._translate_key(key)
-                _LOGGER.debug("Pressing key: %s", key)
-                keyboard.tap(key_code)
-            time.sleep(self.key_delay)
+        # Key presses are paced against absolute deadlines so that sleep
+        # overshoot does not accumulate over long scroll runs.
+        with _high_resolution_timer():
+            deadline = time.perf_counter()
+            # Navigation sequences are mostly long runs of the same scroll
+            # event, so resolve the action once per run instead of per key.
+            for key, run in groupby(keys):
+                count = sum(1 for _ in run)
+                if key == SCROLL_UP_KEY:
+                    _LOGGER.debug("Scrolling up via mouse wheel (x%d)", count)
+                    press = partial(self._ensure_mouse_controller().scroll, 0, 1)
+                elif key == SCROLL_DOWN_KEY:
+                    _LOGGER.debug("Scrolling down via mouse wheel (x%d)", count)
+                    press = partial(self._ensure_mouse_controller().scroll, 0, -1)
+                else:
+                    key_code = self._translate_key(key)
+                    _LOGGER.debug("Pressing key: %s (x%d)", key, count)
+                    press = partial(self._ensure_keyboard_controller().tap, key_code)
+                for _ in range(count):
+                    press()
+                    deadline += self.key_delay
+                    now = time.perf_counter()
+                    if now < deadline:
+                        _sleep_until(deadline)
+                    else:
+                        # Running late: restart the schedule rather than
+                        # bursting keys to catch up.
+                        deadline = now
 
     # Internal utilities -------------------------------------------------
+    def _wait_until_active(self, window) -> None:
+        # Polling only detects the switch to the foreground; the game still
+        # needs ``activation_delay`` afterwards before it reliably takes input,
+        # otherwise the leading reset keys can be dropped.
+        for delay in _ACTIVATION_POLL_DELAYS:
+            if window.isActive:
+                break
+            time.sleep(delay)
+        else:
+            if not window.isActive:
+                _LOGGER.debug("DJMAX window did not report itself active")
+        time.sleep(self.activation_delay)
+
+    def _ensure_window_module(self):
+        if self._window_module is None:
+            try:
+                import pygetwindow  # type: ignore
+            except ImportError as exc:  # pragma: no cover - requires Windows
+                raise RuntimeError(
+                    "pygetwindow 모듈이 설치되어 있지 않습니다. 'pip install pygetwindow' 를 실행해주세요."
+                ) from exc
+
+            self._window_module = pygetwindow
+        return self._window_module
+
+    def _find_window(self):
+        # Enumerating every top-level window is comparatively slow, so reuse
+        # the last match for as long as its handle still carries the title.
+        window = self._window
+        if window is not None:
+            try:
+                if self.window_title in window.title:
+                    return window
+            except Exception:  # pragma: no cover - window handle was closed
+                pass
+            self._window = None
+
+        window_module = self._ensure_window_module()
+        windows = window_module.getWindowsWithTitle(self.window_title)
+        if not windows:
+            raise RuntimeError(
+                f"'{self.window_title}' 제목의 창을 찾을 수 없습니다. DJMAX RESPECT V 가 실행 중인지 확인해주세요."
+            )
+
+        self._window = windows[0]
+        return self._window
+
     def _ensure_keyboard_module(self):
         if self._keyboard_module is None:
             try:
@@ -136,6 +227,15 @@ class DJMaxInputController(InputController):
         return self._mouse_controller
 
     def _translate_key(self, key: str):
+        # Every navigation repeats the same handful of keys, so remember the
+        # pynput key object instead of resolving it through getattr again.
+        try:
+            return self._key_codes[key]
+        except KeyError:
+            key_code = self._key_codes[key] = self._resolve_key_code(key)
+            return key_code
+
+    def _resolve_key_code(self, key: str):
         keyboard_module = self._ensure_keyboard_module()
         name = key.lower()
         attr_name = _SPECIAL_KEY_NAMES.get(name, name)
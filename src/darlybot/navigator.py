@@ -1,18 +1,29 @@
 """High level orchestration for selecting songs."""
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Optional, Sequence, Tuple
 
 from .song_index import SongEntry, SongIndex, SongNotFoundError
 
-__all__ = ["NavigationError", "NavigationResult", "SongNavigator"]
+__all__ = [
+    "NavigationBusyError",
+    "NavigationError",
+    "NavigationResult",
+    "SongNavigator",
+]
 
 
 class NavigationError(RuntimeError):
     """Raised when the navigator cannot perform the requested action."""
 
 
+class NavigationBusyError(NavigationError):
+    """Raised when another navigation is still sending its key presses."""
+
+
 @dataclass
 class NavigationResult:
     """Information about a navigation request.
@@ -36,9 +47,22 @@ class NavigationResult:
 class SongNavigator:
     """Orchestrates locating the desired song and sending the key sequence."""
 
-    def __init__(self, index: SongIndex, controller: "InputController"):
+    def __init__(
+        self,
+        index: SongIndex,
+        controller: "InputController",
+        *,
+        repeat_window: float = 0.5,
+        page_size: int = 0,
+    ):
         self.index = index
         self.controller = controller
+        self.repeat_window = repeat_window
+        self.page_size = page_size
+        # Held while keys are being sent; concurrent requests fail fast instead
+        # of queueing a second sequence behind the first.
+        self._busy = threading.Lock()
+        self._last: Optional[Tuple[int, float, NavigationResult]] = None
 
     def navigate(
         self,
@@ -58,24 +82,46 @@ class SongNavigator:
         dry_run:
             When ``True`` the method only returns the generated key sequence and
             does not send any key events.
+
+        Requesting the song that was just navigated to again within
+        ``repeat_window`` seconds returns the previous result without sending
+        the keys a second time.  While another request is still sending keys
+        :class:`NavigationBusyError` is raised.
         """
 
         if not title_number and not title:
             raise NavigationError("title 또는 title_number 중 하나는 반드시 필요합니다.")
 
         entry = self._resolve_entry(title_number=title_number, title=title)
-        keys = self.index.key_sequence_for(entry)
-        performed = False
+        keys = self.index.key_sequence_for(entry, page_size=self.page_size)
+
+        if dry_run:
+            return NavigationResult(entry=entry, keys=tuple(keys), performed=False)
+
+        if not self._busy.acquire(blocking=False):
+            raise NavigationBusyError("이전 키 입력이 아직 진행 중입니다.")
+        try:
+            # A double click on the same tile would replay the whole sequence
+            # from the top, so repeats inside ``repeat_window`` reuse the result.
+            last = self._last
+            if (
+                last is not None
+                and last[0] == entry.index
+                and time.monotonic() - last[1] < self.repeat_window
+            ):
+                return last[2]
 
-        if not dry_run:
             try:
                 self.controller.focus_window()
                 self.controller.send_keys(keys)
             except Exception as exc:  # pragma: no cover - integration layer
                 raise NavigationError(str(exc)) from exc
-            performed = True
 
-        return NavigationResult(entry=entry, keys=tuple(keys), performed=performed)
+            result = NavigationResult(entry=entry, keys=tuple(keys), performed=True)
+            self._last = (entry.index, time.monotonic(), result)
+            return result
+        finally:
+            self._busy.release()
 
     def _resolve_entry(
         self, *, title_number: Optional[str], title: Optional[str]
@@ -2,21 +2,28 @@
 from __future__ import annotations
 
 import html
-import json
 import logging
+import sys
 import threading
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
-from .navigator import NavigationError, SongNavigator
+from . import _json
+from .navigator import NavigationBusyError, NavigationError, SongNavigator
 from .song_index import SongIndex, SongNotFoundError
 
 __all__ = ["SongServer"]
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Before Python 3.14 a blocked ``Event.wait()`` cannot be interrupted by
+#: Ctrl+C on Windows, so wake up occasionally there; elsewhere wait outright.
+_STOP_WAIT_TIMEOUT: Optional[float] = (
+    1.0 if sys.platform == "win32" and sys.version_info < (3, 14) else None
+)
+
 _HOME_TEMPLATE = """<!DOCTYPE html>
 <html lang=\"ko\">
   <head>
@@ -68,6 +75,9 @@ class SongServer:
         self.allow_cors = allow_cors
         self._httpd: Optional[ThreadingHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
+        self._homepage: Optional[str] = None
+        self._songs_json: Optional[bytes] = None
+        self._stopped = threading.Event()
 
     # Lifecycle ---------------------------------------------------------
     def start(self) -> None:
@@ -76,45 +86,77 @@ class SongServer:
 
         handler = self._build_handler()
         self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
-        # If ``port`` is 0 the OS will pick an available port.  Surface the
-        # actual port so integrations (and tests) can discover it.
-        self.port = self._httpd.server_address[1]
+        self._stopped.clear()
         self._thread = threading.Thread(
-            target=self._httpd.serve_forever, name="SongServer", daemon=True
+            target=self._run, args=(self._httpd,), name="SongServer", daemon=True
         )
         self._thread.start()
+        # If ``port`` is 0 the OS will pick an available port.  Surface the
+        # actual port so integrations (and tests) can discover it; this is
+        # done last so that seeing it means the serve loop has been started
+        # and ``stop()`` cannot block on a server that never runs.
+        self.port = self._httpd.server_address[1]
+        self._homepage = None
         _LOGGER.info("Song server listening on http://%s:%s", self.host, self.port)
 
     def serve_forever(self) -> None:  # pragma: no cover - integration utility
         self.start()
         try:
-            while self._thread and self._thread.is_alive():
-                self._thread.join(0.5)
+            while not self._stopped.wait(_STOP_WAIT_TIMEOUT):
+                pass
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
 
     def stop(self) -> None:
-        if self._httpd is None:
+        self._stopped.set()
+        # ``stop`` may be called from another thread while ``serve_forever``
+        # unwinds, so detach the server before shutting it down.
+        httpd, self._httpd = self._httpd, None
+        thread, self._thread = self._thread, None
+        if httpd is None:
             return
         _LOGGER.info("Stopping song server")
-        self._httpd.shutdown()
-        self._httpd.server_close()
-        self._httpd = None
-        if self._thread:
-            self._thread.join(timeout=1)
-            self._thread = None
+        httpd.shutdown()
+        httpd.server_close()
+        if thread:
+            thread.join(timeout=1)
+
+    def _run(self, httpd: ThreadingHTTPServer) -> None:
+        try:
+            httpd.serve_forever()
+        finally:
+            # Release ``serve_forever`` callers if the loop exits on its own.
+            self._stopped.set()
 
     def _render_homepage(self) -> str:
-        """Return an informational HTML page for ``GET /`` requests."""
+        """Return an informational HTML page for ``GET /`` requests.
 
-        return _HOME_TEMPLATE.format(
-            host=html.escape(self.host),
-            port=html.escape(str(self.port)),
-            csv_path=html.escape(str(self.index.csv_path)),
-            song_count=len(self.index),
-        )
+        Everything on the page is fixed once the server is bound, so the
+        markup is rendered on first use and reused afterwards.
+        """
+
+        if self._homepage is None:
+            self._homepage = _HOME_TEMPLATE.format(
+                host=html.escape(self.host),
+                port=html.escape(str(self.port)),
+                csv_path=html.escape(str(self.index.csv_path)),
+                song_count=len(self.index),
+            )
+        return self._homepage
+
+    def _songs_payload(self) -> bytes:
+        """Return the encoded ``GET /songs`` response.
+
+        The index does not change while the server runs, so the JSON is
+        serialised on the first request and reused afterwards.
+        """
+
+        if self._songs_json is None:
+            songs = [entry.to_payload() for entry in self.index]
+            self._songs_json = _json.dumps({"songs": songs})
+        return self._songs_json
 
     # Handler -----------------------------------------------------------
     def _build_handler(self):
@@ -122,6 +164,11 @@ class SongServer:
 
         class Handler(BaseHTTPRequestHandler):
             server_version = "DarlyBot/1.0"
+            # Buffer the response so headers and body leave in a single send
+            # (flushed after each request), and disable Nagle so that send is
+            # not held back waiting for an ACK.
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
 
             def log_message(self, format: str, *args: Any) -> None:  # pragma: no cover
                 _LOGGER.info("%s - %s", self.address_string(), format % args)
@@ -137,7 +184,9 @@ class SongServer:
                 self.end_headers()
 
             def _write_json(self, data: Dict[str, Any], status: HTTPStatus = HTTPStatus.OK) -> None:
-                payload = json.dumps(data).encode("utf-8")
+                self._write_encoded_json(_json.dumps(data), status)
+
+            def _write_encoded_json(self, payload: bytes, status: HTTPStatus = HTTPStatus.OK) -> None:
                 self._set_headers(status)
                 self.wfile.write(payload)
 
@@ -150,7 +199,13 @@ class SongServer:
                 self.wfile.write(payload)
 
             def _parse_path(self) -> str:
-                return urlparse(self.path).path
+                target = self.path
+                if target.startswith("/") and not target.startswith("//") and ";" not in target:
+                    # Plain origin-form target: only the query string and
+                    # fragment need dropping, which avoids a full URL parse.
+                    return target.partition("?")[0].partition("#")[0]
+                # Absolute-form targets and other unusual shapes.
+                return urlparse(target).path
 
             def _read_json(self) -> Dict[str, Any]:
                 length = int(self.headers.get("Content-Length", "0"))
@@ -158,8 +213,8 @@ class SongServer:
                     return {}
                 body = self.rfile.read(length)
                 try:
-                    return json.loads(body.decode("utf-8"))
-                except json.JSONDecodeError as exc:
+                    return _json.loads(body)
+                except ValueError as exc:
                     raise ValueError("잘못된 JSON 데이터입니다.") from exc
 
             # HTTP verbs ------------------------------------------------
@@ -173,8 +228,7 @@ class SongServer:
                 elif path == "/ping":
                     self._write_json({"status": "ok"})
                 elif path == "/songs":
-                    songs = [entry.to_payload() for entry in server.index]
-                    self._write_json({"songs": songs})
+                    self._write_encoded_json(server._songs_payload())
                 else:
                     self._write_json_error(HTTPStatus.NOT_FOUND, "알 수 없는 경로입니다.")
 
@@ -204,6 +258,9 @@ class SongServer:
                 except SongNotFoundError as exc:
                     self._write_json({"error": str(exc)}, HTTPStatus.NOT_FOUND)
                     return
+                except NavigationBusyError as exc:
+                    self._write_json({"error": str(exc)}, HTTPStatus.CONFLICT)
+                    return
                 except NavigationError as exc:
                     self._write_json({"error": str(exc)}, HTTPStatus.BAD_REQUEST)
                     return
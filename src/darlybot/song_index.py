@@ -5,8 +5,9 @@ import contextlib
 import csv
 import io
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
 import unicodedata
 
 __all__ = [
@@ -16,13 +17,72 @@ __all__ = [
     "SongIndexError",
     "SCROLL_UP_KEY",
     "SCROLL_DOWN_KEY",
+    "PAGE_UP_KEY",
+    "PAGE_DOWN_KEY",
 ]
 
 SCROLL_UP_KEY = "scroll_up"
 SCROLL_DOWN_KEY = "scroll_down"
+PAGE_UP_KEY = "pageup"
+PAGE_DOWN_KEY = "pagedown"
 
+def _is_hangul_code(code: int) -> bool:
+    """Return whether code point ``code`` is Hangul.
 
-@dataclass(frozen=True)
+    Covers the syllables (checked first, as nearly every real title uses
+    them), the Jamo blocks, the tone marks and the enclosed and halfwidth
+    forms.  Written as inline comparisons because this runs for each title
+    on load.
+    """
+
+    return (
+        0xAC00 <= code <= 0xD7A3  # Hangul Syllables
+        or 0x1100 <= code <= 0x11FF  # Hangul Jamo
+        or 0x3130 <= code <= 0x318F  # Hangul Compatibility Jamo
+        or 0xA960 <= code <= 0xA97F  # Hangul Jamo Extended-A
+        or 0xD7B0 <= code <= 0xD7FF  # Hangul Jamo Extended-B
+        or 0x302E <= code <= 0x302F  # Hangul tone marks
+        or 0x3200 <= code <= 0x321C  # Parenthesised Hangul
+        or 0x3260 <= code <= 0x327B  # Circled Hangul
+        or code == 0x327E  # Circled Hangul IEUNG U
+        or 0xFFA0 <= code <= 0xFFDC  # Halfwidth Hangul
+    )
+
+
+def _is_hanja_code(code: int) -> bool:
+    """Return whether code point ``code`` is a CJK ideograph (hanja)."""
+
+    return (
+        0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
+        or 0x3400 <= code <= 0x4DBF  # Extension A
+        or 0xF900 <= code <= 0xFAFF  # CJK Compatibility Ideographs
+        or 0x20000 <= code <= 0x2A6DF  # Extension B
+        or 0x2A700 <= code <= 0x2EBEF  # Extensions C-F
+        or 0x2EBF0 <= code <= 0x2EE5F  # Extension I
+        or 0x2F800 <= code <= 0x2FA1F  # Compatibility Ideographs Supplement
+        or 0x30000 <= code <= 0x323AF  # Extensions G-H
+    )
+
+
+#: Read buffer for song CSV files; large enough to fetch typical files at once.
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=4096)
+def _normalise_text(text: str) -> str:
+    """Return the lookup key for ``text``.
+
+    Lookups by title usually repeat the same handful of songs, so the result
+    is cached at module level rather than per :class:`SongIndex`.
+    """
+
+    if text.isascii():
+        # NFKC leaves ASCII untouched, so skip the Unicode tables.
+        return text.casefold().strip()
+    return unicodedata.normalize("NFKC", text).casefold().strip()
+
+
+@dataclass(frozen=True, slots=True)
 class SongEntry:
     """Represents a single song row from ``곡순서.csv``."""
 
@@ -95,9 +155,15 @@ class SongIndex:
 
     @property
     def entries(self) -> Sequence[SongEntry]:
-        return tuple(self._entries)
+        return self._entries_view
 
     def get_by_title_number(self, title_number: str) -> SongEntry:
+        # Well-formed requests send the number exactly as stored in the CSV,
+        # so try it verbatim before converting and stripping it.
+        if isinstance(title_number, str):
+            entry = self._by_number.get(title_number)
+            if entry is not None:
+                return entry
         try:
             return self._by_number[str(title_number).strip()]
         except KeyError as exc:  # pragma: no cover - trivial mapping lookup
@@ -125,7 +191,7 @@ class SongIndex:
         return self._first_index_by_letter[letter]
 
     # Key calculation ---------------------------------------------------
-    def key_sequence_for(self, entry: SongEntry) -> List[str]:
+    def key_sequence_for(self, entry: SongEntry, *, page_size: int = 0) -> List[str]:
         """Return the sequence of keys required to reach ``entry``.
 
         The sequence begins by resetting the list to its initial position using
@@ -134,32 +200,31 @@ class SongIndex:
         jump to the bucket.  For the ``한자``, ``한글``, ``특수문자`` and ``숫자``
         buckets the selection simply scrolls down from the top.  The remaining
         keys are scroll events that move from the bucket's first song to the
-        desired entry.
+        desired entry.  When ``page_size`` is positive, whole pages of that
+        many songs are covered with ``Page Up``/``Page Down`` first.
         """
 
         steps: List[str] = list(self._RESET_SEQUENCE)
-
-        if self._is_ascii_letter(entry.letter):
-            steps.append(entry.letter.lower())
-            current_index = self.letter_anchor(entry.letter)
-        elif entry.letter in (self._SYMBOL_LETTER, self._NUMBER_LETTER):
-            anchor_letter = "A"
-            try:
-                current_index = self.letter_anchor(anchor_letter)
-            except SongIndexError:
-                current_index = 0
-            else:
-                steps.append(anchor_letter.lower())
+        position = entry.index
+        if 0 <= position < len(self._entries) and self._entries[position] is entry:
+            jump_key, offset = self._navigation[position]
         else:
-            current_index = 0
+            # The entry came from another index (e.g. an older copy of the
+            # CSV), so derive its keys from its letter against this one.
+            jump_key, anchor_index = self._anchor_for(entry.letter)
+            offset = position - anchor_index
+        if jump_key is not None:
+            steps.append(jump_key)
 
-        offset = entry.index - current_index
         if offset < 0:
-            arrow = SCROLL_UP_KEY
+            arrow, page_key = SCROLL_UP_KEY, PAGE_UP_KEY
         else:
-            arrow = SCROLL_DOWN_KEY
-        for _ in range(abs(offset)):
-            steps.append(arrow)
+            arrow, page_key = SCROLL_DOWN_KEY, PAGE_DOWN_KEY
+        distance = abs(offset)
+        if page_size > 0:
+            pages, distance = divmod(distance, page_size)
+            steps.extend([page_key] * pages)
+        steps.extend([arrow] * distance)
         return steps
 
     # ------------------------------------------------------------------
@@ -169,6 +234,9 @@ class SongIndex:
         self._by_number: Dict[str, SongEntry] = {}
         self._by_title: Dict[str, SongEntry] = {}
         self._first_index_by_letter: Dict[str, int] = {}
+        # Per-entry ``(jump key, scroll offset)`` pairs, filled in after loading.
+        self._navigation: List[Tuple[Optional[str], int]] = []
+        self._entries_view: Tuple[SongEntry, ...] = ()
 
     def _load_from_path(self) -> None:
         if not self.csv_path.exists():
@@ -176,7 +244,9 @@ class SongIndex:
                 f"곡순서.csv 파일을 찾을 수 없습니다: {self.csv_path}"
             )
 
-        with self.csv_path.open("r", encoding="utf-8-sig", newline="") as fh:
+        with self.csv_path.open(
+            "r", encoding="utf-8-sig", newline="", buffering=_CSV_BUFFER_SIZE
+        ) as fh:
             self._load_from_file(fh)
 
     def _load_from_text(self, csv_text: str) -> None:
@@ -185,68 +255,121 @@ class SongIndex:
             self._load_from_file(fh)
 
     def _load_from_file(self, fh: TextIO) -> None:
-        reader = csv.DictReader(fh)
-        if not reader.fieldnames:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if not header:
             raise SongIndexError(
                 "곡순서.csv 파일에 헤더가 없습니다. 'title_number,title' 형식을 사용하세요."
             )
-        headers = {name.lower(): name for name in reader.fieldnames}
+        # Resolve the column positions once instead of building a dict per row.
+        headers = {name.lower(): position for position, name in enumerate(header)}
         if "title_number" not in headers or "title" not in headers:
             raise SongIndexError(
                 "곡순서.csv 파일은 'title_number' 와 'title' 헤더를 포함해야 합니다."
             )
 
-        title_number_key = headers["title_number"]
-        title_key = headers["title"]
+        title_number_idx = headers["title_number"]
+        title_idx = headers["title"]
+        normalise = self._normalise_text
+        derive_anchor = self._derive_anchor
+        entries = self._entries
+        append_entry = entries.append
+        by_number = self._by_number
+        by_title = self._by_title
+        first_index_by_letter = self._first_index_by_letter
 
         for row in reader:
-            title_number = str(row.get(title_number_key, "")).strip()
-            title = str(row.get(title_key, "")).strip()
+            width = len(row)
+            title_number = (
+                row[title_number_idx].strip() if title_number_idx < width else ""
+            )
+            title = row[title_idx].strip() if title_idx < width else ""
             if not title:
                 # Skip completely empty rows to make editing easier.
                 continue
-            letter = self._derive_anchor(title)
+            letter = derive_anchor(title)
+            position = len(entries)
             entry = SongEntry(
-                index=len(self._entries),
+                index=position,
                 title_number=title_number,
                 title=title,
                 letter=letter,
             )
-            self._entries.append(entry)
+            append_entry(entry)
             if title_number:
-                self._by_number[title_number] = entry
-            self._by_title[self._normalise_text(title)] = entry
-            self._first_index_by_letter.setdefault(letter, entry.index)
+                by_number[title_number] = entry
+            by_title[normalise(title)] = entry
+            # Only a few dozen letters exist, so this is almost always a hit.
+            if letter not in first_index_by_letter:
+                first_index_by_letter[letter] = position
+
+        self._entries_view = tuple(self._entries)
+        self._build_navigation()
+
+    def _build_navigation(self) -> None:
+        # Anchors only depend on the letter bucket, and there are just a few
+        # dozen of those, so resolve each bucket once.
+        anchors: Dict[str, Tuple[Optional[str], int]] = {}
+        navigation = []
+        for entry in self._entries:
+            anchor = anchors.get(entry.letter)
+            if anchor is None:
+                anchor = anchors[entry.letter] = self._anchor_for(entry.letter)
+            jump_key, anchor_index = anchor
+            navigation.append((jump_key, entry.index - anchor_index))
+        self._navigation = navigation
+
+    def _anchor_for(self, letter: str) -> Tuple[Optional[str], int]:
+        """Return the key that jumps to ``letter``'s bucket and where it lands."""
+
+        if self._is_ascii_letter(letter):
+            return letter.lower(), self.letter_anchor(letter)
+        if letter in (self._SYMBOL_LETTER, self._NUMBER_LETTER):
+            anchor_letter = "A"
+            try:
+                return anchor_letter.lower(), self.letter_anchor(anchor_letter)
+            except SongIndexError:
+                return None, 0
+        return None, 0
 
     def _derive_anchor(self, title: str) -> str:
-        for char in self._iter_significant_chars(title):
-            if self._is_hanja(char):
+        for char in title:
+            if char.isspace():
+                continue
+            if char.isascii():
+                # Most titles start with an ASCII character, which never
+                # needs the Unicode database to classify.
+                if char.isdigit():
+                    return self._NUMBER_LETTER
+                if char.isalpha():
+                    return char.upper()
+                return self._SYMBOL_LETTER
+            code = ord(char)
+            # The two blocks nearly every non-ASCII title starts with first;
+            # the ranges are disjoint, so the order does not change results.
+            if 0xAC00 <= code <= 0xD7A3:
+                return self._HANGUL_LETTER
+            if 0x4E00 <= code <= 0x9FFF:
+                return self._HANJA_LETTER
+            if _is_hanja_code(code):
                 return self._HANJA_LETTER
-            if self._is_hangul(char):
+            if _is_hangul_code(code):
                 return self._HANGUL_LETTER
             if char.isdigit():
                 return self._NUMBER_LETTER
-            if char.isascii() and char.isalpha():
-                return char.upper()
             return self._SYMBOL_LETTER
         raise SongIndexError(
             f"제목 '{title}' 에서 탐색에 사용할 시작 문자를 찾을 수 없습니다."
         )
 
-    def _iter_significant_chars(self, text: str) -> Iterable[str]:
-        for char in text:
-            if char.isspace():
-                continue
-            yield char
-
     def _is_hangul(self, char: str) -> bool:
-        return "HANGUL" in unicodedata.name(char, "")
+        return _is_hangul_code(ord(char))
 
     def _is_hanja(self, char: str) -> bool:
-        return "CJK UNIFIED IDEOGRAPH" in unicodedata.name(char, "")
+        return _is_hanja_code(ord(char))
 
     def _is_ascii_letter(self, letter: str) -> bool:
         return len(letter) == 1 and letter.isascii() and letter.isalpha()
 
     def _normalise_text(self, text: str) -> str:
-        return unicodedata.normalize("NFKC", text).casefold().strip()
+        return _normalise_text(text)
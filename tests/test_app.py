@@ -0,0 +1,79 @@
+import logging
+import ntpath
+import os
+import sys
+
+from darlybot import app
+
+
+def test_version_flag_prints_version(capsys) -> None:
+    assert app.main(["--version"]) == 0
+    assert capsys.readouterr().out.startswith("darlybot ")
+
+
+def test_resolve_csv_path_prefers_working_directory(tmp_path, monkeypatch) -> None:
+    (tmp_path / "곡순서.csv").write_text("title_number,title\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    assert app.resolve_csv_path(None) == tmp_path / "곡순서.csv"
+
+
+def test_resolve_csv_path_checks_data_directory(tmp_path, monkeypatch) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "곡순서.csv").write_text("title_number,title\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    assert app.resolve_csv_path(None) == tmp_path / "data" / "곡순서.csv"
+
+
+def test_resolve_csv_path_ignores_case_on_windows(tmp_path, monkeypatch) -> None:
+    (tmp_path / "Data").mkdir()
+    csv_path = tmp_path / "Data" / "곡순서.CSV"
+    csv_path.write_text("title_number,title\n", encoding="utf-8")
+    # Fold names the way Windows does, whatever platform runs the test.
+    monkeypatch.setattr(app, "_normcase", ntpath.normcase)
+    monkeypatch.chdir(tmp_path)
+    assert app.resolve_csv_path(None) == csv_path
+
+
+def test_argument_parser_is_reused() -> None:
+    assert app.build_argument_parser() is app.build_argument_parser()
+
+
+def test_configure_logging_keeps_existing_handlers() -> None:
+    root = logging.getLogger()
+    handler = logging.NullHandler()
+    root.addHandler(handler)
+    try:
+        before = list(root.handlers)
+        app.configure_logging(logging.DEBUG)
+        assert root.handlers == before
+    finally:
+        root.removeHandler(handler)
+
+
+def test_load_song_index_reuses_unchanged_file(tmp_path) -> None:
+    csv_path = tmp_path / "곡순서.csv"
+    csv_path.write_text("title_number,title\n1,Alpha\n", encoding="utf-8")
+
+    first = app.load_song_index(csv_path)
+    assert app.load_song_index(csv_path) is first
+
+    csv_path.write_text("title_number,title\n1,Alpha\n2,Beta\n", encoding="utf-8")
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = app.load_song_index(csv_path)
+    assert reloaded is not first
+    assert len(reloaded) == 2
+
+
+def test_configure_logging_without_stderr(monkeypatch) -> None:
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(sys, "stderr", None)
+    app.configure_logging(logging.INFO)
+    assert [type(handler) for handler in root.handlers] == [logging.NullHandler]
+
+
+def test_default_arguments_match_parser_defaults() -> None:
+    parsed = app.build_argument_parser().parse_args([])
+    assert vars(parsed) == vars(app._DEFAULT_ARGS)
@@ -1,3 +1,5 @@
+import time
+
 from darlybot.input_controller import DJMaxInputController
 from darlybot.song_index import SCROLL_DOWN_KEY, SCROLL_UP_KEY
 
@@ -55,3 +57,114 @@ def test_send_keys_translates_special_keys() -> None:
 
     assert keyboard.tapped == [_FakeKey.shift_r, _FakeKey.shift, "char:a"]
     assert mouse.scroll_events == [(0, -1), (0, 1)]
+
+
+def test_send_keys_repeats_runs_of_the_same_key() -> None:
+    controller = DJMaxInputController(key_delay=0.0)
+    controller._keyboard_module = _FakeKeyboardModule()  # type: ignore[attr-defined]
+    controller._keyboard_controller = _FakeKeyboardController()  # type: ignore[attr-defined]
+    controller._mouse_controller = _FakeMouseController()  # type: ignore[attr-defined]
+
+    controller.send_keys(["b", *[SCROLL_DOWN_KEY] * 3, SCROLL_UP_KEY])
+
+    keyboard = controller._keyboard_controller  # type: ignore[attr-defined]
+    mouse = controller._mouse_controller  # type: ignore[attr-defined]
+
+    assert keyboard.tapped == ["char:b"]
+    assert mouse.scroll_events == [(0, -1), (0, -1), (0, -1), (0, 1)]
+
+
+class _FakeWindow:
+    def __init__(self, title: str) -> None:
+        self.title = title
+        self.isMinimized = False
+        self.isActive = False
+        self.activations = 0
+
+    def activate(self) -> None:
+        self.activations += 1
+        self.isActive = True
+
+
+class _FakeWindowModule:
+    def __init__(self, *windows: _FakeWindow) -> None:
+        self.windows = list(windows)
+        self.lookups = 0
+
+    def getWindowsWithTitle(self, title: str) -> list[_FakeWindow]:
+        self.lookups += 1
+        return [window for window in self.windows if title in window.title]
+
+
+def test_focus_window_reuses_cached_window() -> None:
+    window = _FakeWindow("DJMAX RESPECT V")
+    module = _FakeWindowModule(window)
+    controller = DJMaxInputController(activation_delay=0.0)
+    controller._window_module = module  # type: ignore[attr-defined]
+
+    controller.focus_window()
+    controller.focus_window()
+
+    assert module.lookups == 1
+    assert window.activations == 2
+
+
+def test_focus_window_rescans_when_cached_window_changes() -> None:
+    window = _FakeWindow("DJMAX RESPECT V")
+    module = _FakeWindowModule(window)
+    controller = DJMaxInputController(activation_delay=0.0)
+    controller._window_module = module  # type: ignore[attr-defined]
+
+    controller.focus_window()
+    window.title = ""
+    replacement = _FakeWindow("DJMAX RESPECT V")
+    module.windows = [replacement]
+    controller.focus_window()
+
+    assert module.lookups == 2
+    assert replacement.activations == 1
+
+
+def test_focus_window_settles_once_window_is_active(monkeypatch) -> None:
+    window = _FakeWindow("DJMAX RESPECT V")
+    controller = DJMaxInputController(activation_delay=0.3)
+    controller._window_module = _FakeWindowModule(window)  # type: ignore[attr-defined]
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    controller.focus_window()
+
+    # No polling once the window is active, but the settle delay remains.
+    assert sleeps == [0.3]
+
+
+def test_focus_window_polls_until_window_is_active(monkeypatch) -> None:
+    window = _FakeWindow("DJMAX RESPECT V")
+    window.activate = lambda: None  # type: ignore[method-assign]
+    controller = DJMaxInputController(activation_delay=0.3)
+    controller._window_module = _FakeWindowModule(window)  # type: ignore[attr-defined]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            window.isActive = True
+
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    controller.focus_window()
+
+    assert sleeps == [0.01, 0.02, 0.3]
+
+
+def test_translated_keys_are_cached() -> None:
+    controller = DJMaxInputController(key_delay=0.0)
+    controller._keyboard_module = _FakeKeyboardModule()  # type: ignore[attr-defined]
+    controller._keyboard_controller = _FakeKeyboardController()  # type: ignore[attr-defined]
+
+    controller.send_keys(["shift", "a"])
+    controller._keyboard_module = None  # type: ignore[attr-defined]
+    controller.send_keys(["a", "shift"])
+
+    keyboard = controller._keyboard_controller  # type: ignore[attr-defined]
+    assert keyboard.tapped == [_FakeKey.shift, "char:a", "char:a", _FakeKey.shift]
@@ -0,0 +1,23 @@
+import pytest
+
+from darlybot import _json
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_round_trip_preserves_korean_text(backend) -> None:
+    payload = _json.dumps({"title": "고백, 꽃, 늑대", "index": 1})
+    assert isinstance(payload, bytes)
+    assert _json.loads(payload) == {"title": "고백, 꽃, 늑대", "index": 1}
+
+
+def test_invalid_payload_raises_value_error(backend) -> None:
+    with pytest.raises(ValueError):
+        _json.loads(b"{invalid")
+    with pytest.raises(ValueError):
+        _json.loads(b"\xff")
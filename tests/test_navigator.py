@@ -1,7 +1,7 @@
 import pytest
 
 from darlybot.input_controller import SimulatedInputController
-from darlybot.navigator import NavigationError, SongNavigator
+from darlybot.navigator import NavigationBusyError, NavigationError, SongNavigator
 from darlybot.song_index import SCROLL_DOWN_KEY, SongIndex
 
 
@@ -38,3 +38,31 @@ def test_missing_arguments_raise(sample_index):
     navigator = SongNavigator(sample_index, controller)
     with pytest.raises(NavigationError):
         navigator.navigate()
+
+
+def test_repeated_request_is_not_sent_twice(sample_index):
+    controller = SimulatedInputController()
+    navigator = SongNavigator(sample_index, controller)
+    first = navigator.navigate(title="Bolt")
+    second = navigator.navigate(title_number="0003")
+    assert second is first
+    assert controller.sent_keys == ["shift_r", "shift", "b", SCROLL_DOWN_KEY]
+
+
+def test_repeat_window_can_be_disabled(sample_index):
+    controller = SimulatedInputController()
+    navigator = SongNavigator(sample_index, controller, repeat_window=0.0)
+    navigator.navigate(title="Bolt")
+    navigator.navigate(title="Bolt")
+    assert controller.sent_keys == ["shift_r", "shift", "b", SCROLL_DOWN_KEY] * 2
+
+
+def test_concurrent_navigation_fails_fast(sample_index):
+    controller = SimulatedInputController()
+    navigator = SongNavigator(sample_index, controller)
+    with navigator._busy:
+        with pytest.raises(NavigationBusyError):
+            navigator.navigate(title="Alpha")
+    assert not controller.sent_keys
+    # Dry runs never touch the controller and are always allowed.
+    assert navigator.navigate(title="Alpha", dry_run=True).keys
@@ -1,4 +1,6 @@
+import http.client
 import json
+import threading
 import time
 import urllib.error
 import urllib.request
@@ -58,6 +60,39 @@ def test_ping_endpoint(sample_server):
     assert payload == {"status": "ok"}
 
 
+def test_query_string_is_ignored_for_routing(sample_server):
+    server, _ = sample_server
+    payload = _request_json(f"http://{server.host}:{server.port}/ping?t=1")
+    assert payload == {"status": "ok"}
+
+
+@pytest.mark.parametrize("target", ["http://{host}:{port}/ping", "/ping#top"])
+def test_absolute_and_fragment_targets_are_routed(sample_server, target):
+    server, _ = sample_server
+    conn = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        conn.request("GET", target.format(host=server.host, port=server.port))
+        response = conn.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read().decode("utf-8")) == {"status": "ok"}
+    finally:
+        conn.close()
+
+
+def test_songs_endpoint_lists_index(sample_server):
+    server, _ = sample_server
+    url = f"http://{server.host}:{server.port}/songs"
+    first = _request_json(url)
+    assert [song["title"] for song in first["songs"]] == ["Alpha", "Beta", "Bolt"]
+    assert first["songs"][1] == {
+        "index": 1,
+        "title_number": "0002",
+        "title": "Beta",
+        "letter": "B",
+    }
+    assert _request_json(url) == first
+
+
 def test_root_path_returns_status_page(sample_server):
     server, _ = sample_server
     url = f"http://{server.host}:{server.port}/"
@@ -96,3 +131,26 @@ def test_invalid_json_returns_localised_error(sample_server):
     code, payload = _request_error(url, method="POST", body=b"{invalid")
     assert code == 400
     assert payload == {"error": "잘못된 JSON 데이터입니다."}
+
+
+def test_serve_forever_returns_when_stopped(tmp_path):
+    csv_path = tmp_path / "곡순서.csv"
+    csv_path.write_text("title_number,title\n0001,Alpha\n", encoding="utf-8")
+    index = SongIndex(csv_path)
+    navigator = SongNavigator(index, SimulatedInputController())
+    server = SongServer(navigator, index=index, host="127.0.0.1", port=0)
+
+    runner = threading.Thread(target=server.serve_forever, daemon=True)
+    runner.start()
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if server.port != 0:
+            try:
+                _request_json(f"http://{server.host}:{server.port}/ping")
+                break
+            except OSError:
+                pass
+        time.sleep(0.01)
+    server.stop()
+    runner.join(timeout=2)
+    assert not runner.is_alive()
@@ -3,8 +3,11 @@ from pathlib import Path
 import pytest
 
 from darlybot.song_index import (
+    PAGE_DOWN_KEY,
+    PAGE_UP_KEY,
     SCROLL_DOWN_KEY,
     SCROLL_UP_KEY,
+    SongEntry,
     SongIndex,
     SongNotFoundError,
 )
@@ -39,6 +42,11 @@ def test_lookup_by_title_is_case_insensitive(sample_index: SongIndex) -> None:
     assert entry.title_number == "0006"
 
 
+def test_lookup_by_title_applies_nfkc(sample_index: SongIndex) -> None:
+    entry = sample_index.get_by_title("ＡＬＰＨＡ")
+    assert entry.title_number == "0005"
+
+
 def test_key_sequence_for_first_letter_entry(sample_index: SongIndex) -> None:
     entry = sample_index.get_by_title_number("0005")
     sequence = sample_index.key_sequence_for(entry)
@@ -102,3 +110,71 @@ def test_from_csv_text_supports_embedded_data() -> None:
     entry = index.get_by_title_number("1000")
     assert entry.title == "Embedded Song"
     assert index.csv_path.name == "embedded.csv"
+
+
+def test_csv_columns_are_resolved_by_header_position() -> None:
+    csv_text = "Title,Extra,Title_Number\nShort Row\nGamma,x,0300\n"
+    index = SongIndex.from_csv_text(csv_text)
+
+    assert [entry.title for entry in index] == ["Short Row", "Gamma"]
+    assert index.entries[0].title_number == ""
+    assert index.get_by_title_number("0300").title == "Gamma"
+
+
+def test_key_sequence_for_uses_pages_when_configured() -> None:
+    titles = "\n".join(f"{number},Song {number:02d}" for number in range(12))
+    index = SongIndex.from_csv_text(f"title_number,title\n{titles}\n")
+
+    entry = index.get_by_title_number("11")
+    sequence = index.key_sequence_for(entry, page_size=5)
+    assert sequence == [
+        "shift_r",
+        "shift",
+        "s",
+        PAGE_DOWN_KEY,
+        PAGE_DOWN_KEY,
+        SCROLL_DOWN_KEY,
+    ]
+
+
+def test_key_sequence_for_pages_upwards(sample_index: SongIndex) -> None:
+    entry = sample_index.get_by_title_number("0003")
+    sequence = sample_index.key_sequence_for(entry, page_size=2)
+    assert sequence == ["shift_r", "shift", "a", PAGE_UP_KEY]
+
+
+@pytest.mark.parametrize(
+    ("title", "letter"),
+    [
+        ("ㄱㄴㄷ", "한글"),  # compatibility jamo
+        ("ﾡ half", "한글"),  # halfwidth hangul
+        ("㈀ mark", "한글"),  # parenthesised hangul
+        ("㉿ mark", "특수문자"),  # korean standard symbol
+        ("㈝ mark", "특수문자"),  # parenthesised korean character
+        ("㐀 ext", "한자"),  # CJK extension A
+        ("豈 compat", "한자"),  # CJK compatibility ideograph
+        ("\U0002EBF0 ext", "한자"),  # CJK extension I
+        ("あいう", "특수문자"),
+    ],
+)
+def test_character_ranges_classify_titles(title: str, letter: str) -> None:
+    index = SongIndex.from_csv_text(f"title_number,title\n0001,{title}\n")
+    assert index.get_by_title_number("0001").letter == letter
+
+
+def test_key_sequence_for_entry_from_another_index(sample_index: SongIndex) -> None:
+    other = SongIndex.from_csv_text(
+        "title_number,title\n0001,Bolt\n0002,Bravo\n0003,Brick\n"
+    )
+    foreign = other.get_by_title_number("0003")
+    # Sample "B" songs start at index 5, so index 2 lies three scrolls above.
+    assert sample_index.key_sequence_for(foreign) == [
+        "shift_r",
+        "shift",
+        "b",
+        SCROLL_UP_KEY,
+        SCROLL_UP_KEY,
+        SCROLL_UP_KEY,
+    ]
+    far = SongEntry(index=99, title_number="x", title="Bx", letter="B")
+    assert sample_index.key_sequence_for(far)[-1] == SCROLL_DOWN_KEY